@@ -7,11 +7,78 @@ Controls:
     Q - Quit
 """
 
+import asyncio
+import atexit
+import collections
+import concurrent.futures
 import curses
+import sys
 import time
 import random
 import os
-import json
+import struct
+
+# Cyclic pool of random bytes used for cosmetic terrain generation, so
+# scrolling doesn't pay for a random.randint() call per column
+_RAND_POOL_SIZE = 4096
+_RAND_POOL = bytes(random.getrandbits(8) for _ in range(_RAND_POOL_SIZE))
+
+FRAME_TIME = 0.05  # Seconds per frame
+
+# bytes.translate() tables mapping a column height to the ground character
+# shown at each level above the bottom row
+_MAX_GROUND_HEIGHT = 15
+_GROUND_ROWS = [bytes(ord('#') if h > level else ord(' ') for h in range(256))
+                for level in range(_MAX_GROUND_HEIGHT)]
+
+# Single background thread for score file writes, drained on exit so a
+# pending save always completes
+_IO = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+atexit.register(_IO.shutdown, wait=True)
+
+# High score file record: a single little-endian unsigned 64-bit integer
+_HIGH_SCORE_RECORD = struct.Struct('<Q')
+
+# HUD row labels, in display order; only the values after them change
+_HUD_LABELS = (
+    "Altitude: ",
+    "Velocity: ",
+    "Distance: ",
+    "Time:     ",
+    "Stars:    ",
+    "Score:    ",
+    "High:     ",
+    "Fuel: ",
+    "Level:    ",
+)
+
+# Fuel gauge bars for 0-10 tenths full
+_FUEL_BARS = ['█' * n + '░' * (10 - n) for n in range(11)]
+
+# Key codes for the controls
+_PITCH = {ord('w'): 1, ord('W'): 1, ord('s'): -1, ord('S'): -1}
+_QUIT = {ord('q'), ord('Q')}
+
+
+def _plane_update(altitude, velocity, pitch_input, screen_height):
+    """Advance the plane's physics one frame. Returns (altitude, velocity)."""
+    # Simple physics
+    gravity = 0.3
+    pitch_force = pitch_input * 1.0
+
+    velocity += pitch_force - gravity
+    velocity *= 0.9  # Air resistance
+
+    altitude -= velocity
+
+    # Keep on screen
+    if altitude < 2:
+        altitude = 2
+        velocity = 0
+    if altitude > screen_height - 3:
+        altitude = screen_height - 3
+        velocity = 0
+    return altitude, velocity
 
 
 class SimplePlane:
@@ -29,22 +96,8 @@ class SimplePlane:
         if self.fuel < 0:
             self.fuel = 0
 
-        # Simple physics
-        gravity = 0.3
-        pitch_force = pitch_input * 1.0
-
-        self.velocity += pitch_force - gravity
-        self.velocity *= 0.9  # Air resistance
-
-        self.altitude -= self.velocity
-
-        # Keep on screen
-        if self.altitude < 2:
-            self.altitude = 2
-            self.velocity = 0
-        if self.altitude > self.screen_height - 3:
-            self.altitude = self.screen_height - 3
-            self.velocity = 0
+        self.altitude, self.velocity = _plane_update(
+            self.altitude, self.velocity, pitch_input, self.screen_height)
 
     def add_fuel(self, amount):
         """Add fuel, capped at max capacity."""
@@ -58,28 +111,40 @@ class SimplePlane:
 class SimpleGround:
     def __init__(self, width):
         self.width = width
-        self.heights = [random.randint(3, 8) for _ in range(width)]
+        # Ring buffer of column heights; logical column 0 lives at heights[head]
+        self._ri = random.randrange(_RAND_POOL_SIZE)
+        self.heights = bytearray(3 + self._next_random() % 6 for _ in range(width))
+        self.head = 0
         self.offset = 0
         self.difficulty = 1
 
+    def _next_random(self):
+        """Return the next byte from the shared random pool."""
+        self._ri = (self._ri + 1) & (_RAND_POOL_SIZE - 1)
+        return _RAND_POOL[self._ri]
+
     def set_difficulty(self, difficulty):
         """Update terrain generation difficulty."""
         self.difficulty = difficulty
 
     def scroll(self):
+        """Advance the terrain. Returns True if a new column scrolled in."""
         self.offset += 1
         if self.offset >= 2:
             self.offset = 0
-            # Add new column, remove old
-            self.heights.pop(0)
+            # Overwrite the oldest column with a new one and advance the head
             # Terrain variation increases with difficulty
             min_height = max(3, 8 - self.difficulty)
-            max_height = min(15, 8 + self.difficulty)
-            self.heights.append(random.randint(min_height, max_height))
+            max_height = min(_MAX_GROUND_HEIGHT, 8 + self.difficulty)
+            span = max_height - min_height + 1
+            self.heights[self.head] = min_height + self._next_random() % span
+            self.head = (self.head + 1) % self.width
+            return True
+        return False
 
     def get_height(self, x):
-        if 0 <= x < len(self.heights):
-            return self.heights[x]
+        if 0 <= x < self.width:
+            return self.heights[(self.head + x) % self.width]
         return 5
 
 
@@ -101,7 +166,7 @@ class DifficultyManager:
 
 
 class ScoreManager:
-    def __init__(self, score_file='.flight_sim_highscore.json'):
+    def __init__(self, score_file='.flight_sim_highscore.bin'):
         self.score_file = score_file
         self.distance = 0
         self.time_survived = 0.0
@@ -113,18 +178,36 @@ class ScoreManager:
         """Load high score from file."""
         if os.path.exists(self.score_file):
             try:
-                with open(self.score_file, 'r') as f:
-                    data = json.load(f)
-                    return data.get('high_score', 0)
+                with open(self.score_file, 'rb') as f:
+                    data = f.read(_HIGH_SCORE_RECORD.size)
+                    return _HIGH_SCORE_RECORD.unpack(data)[0]
             except:
                 return 0
-        return 0
+        return self._migrate_json_high_score()
+
+    def _migrate_json_high_score(self):
+        """Load a high score saved as JSON by older versions and convert it."""
+        legacy_file = os.path.splitext(self.score_file)[0] + '.json'
+        if not os.path.exists(legacy_file):
+            return 0
+        import json  # Only needed for this one-time migration
+        try:
+            with open(legacy_file, 'r') as f:
+                high_score = int(json.load(f).get('high_score', 0))
+        except:
+            return 0
+        self.high_score = high_score
+        self.save_high_score()
+        return high_score
 
     def save_high_score(self):
         """Save high score to file."""
         try:
-            with open(self.score_file, 'w') as f:
-                json.dump({'high_score': self.high_score}, f)
+            # Write to a temp file and swap it in so a crash can't truncate it
+            tmp_file = self.score_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(_HIGH_SCORE_RECORD.pack(self.high_score))
+            os.replace(tmp_file, self.score_file)
         except:
             pass
 
@@ -147,12 +230,17 @@ class ScoreManager:
         current_score = self.get_score()
         if current_score > self.high_score:
             self.high_score = current_score
-            self.save_high_score()
+            _IO.submit(self.save_high_score)  # Don't block the game loop on disk I/O
             return True
         return False
 
 
 class Collectible:
+    __slots__ = ('x', 'y', 'item_type', 'active', 'value', 'fuel')
+
+    # Display character per item type, shared by every instance
+    CHARS = {'star': '*', 'fuel': 'F'}
+
     def __init__(self, x, y, item_type='star'):
         self.x = x
         self.y = y
@@ -160,22 +248,12 @@ class Collectible:
         self.active = True
 
         if item_type == 'star':
-            self.char = '*'
             self.value = 50
             self.fuel = 0
         elif item_type == 'fuel':
-            self.char = 'F'
             self.value = 25
             self.fuel = 30.0
 
-    def scroll(self):
-        """Move collectible left as terrain scrolls."""
-        self.x -= 1
-
-    def is_off_screen(self):
-        """Check if collectible has scrolled off screen."""
-        return self.x < 0
-
 
 class CollectibleManager:
     def __init__(self, width, height):
@@ -186,18 +264,27 @@ class CollectibleManager:
         self.last_spawn = 0
 
     def update(self, frame_count):
-        """Update all collectibles and spawn new ones."""
-        # Scroll existing collectibles
+        """Update all collectibles and spawn new ones.
+
+        Returns True if any collectible moved, disappeared or spawned.
+        """
+        changed = bool(self.collectibles)
+        # Scroll existing collectibles and drop collected or off-screen
+        # ones in a single pass
+        remaining = []
         for item in self.collectibles:
-            item.scroll()
-
-        # Remove off-screen collectibles
-        self.collectibles = [item for item in self.collectibles if not item.is_off_screen() and item.active]
+            if item.active:
+                item.x -= 1
+                if item.x >= 0:
+                    remaining.append(item)
+        self.collectibles = remaining
 
         # Spawn new collectibles
         if frame_count - self.last_spawn >= self.spawn_interval:
             self.spawn()
             self.last_spawn = frame_count
+            changed = True
+        return changed
 
     def spawn(self):
         """Spawn a new collectible at random altitude."""
@@ -214,27 +301,213 @@ class CollectibleManager:
         for item in self.collectibles:
             if item.active:
                 # Check if plane position overlaps with collectible
-                if abs(item.x - plane_x) <= 2 and abs(item.y - plane_y) <= 1:
+                if -2 <= item.x - plane_x <= 2 and -1 <= item.y - plane_y <= 1:
                     item.active = False
                     return (item.value, item.fuel)
         return (0, 0)
 
     def draw(self, stdscr):
         """Draw all active collectibles."""
+        # Turn bold on once for the whole batch rather than per item
+        stdscr.attron(curses.A_BOLD)
         for item in self.collectibles:
             if item.active:
                 try:
-                    stdscr.addstr(int(item.y), int(item.x), item.char, curses.A_BOLD)
+                    stdscr.addstr(int(item.y), int(item.x), Collectible.CHARS[item.item_type])
                 except:
                     pass
+        stdscr.attroff(curses.A_BOLD)
+
+
+class FrameBuffer:
+    """Off-screen character grid that only pushes changed cells to curses."""
+
+    def __init__(self, height, width):
+        self.height = height
+        self.width = width
+        self.prev = [[' '] * width for _ in range(height)]
+        self.cur = [[' '] * width for _ in range(height)]
+        self.prev_attrs = [[0] * width for _ in range(height)]
+        self.cur_attrs = [[0] * width for _ in range(height)]
+        self.attr = 0  # Attributes applied to every write, like a curses window
+
+    def clear(self):
+        """Blank the frame being drawn."""
+        blank = [' '] * self.width
+        no_attr = [0] * self.width
+        for y in range(self.height):
+            self.cur[y][:] = blank
+            self.cur_attrs[y][:] = no_attr
+
+    def attron(self, attr):
+        """Turn on attributes for subsequent writes."""
+        self.attr |= attr
+
+    def attroff(self, attr):
+        """Turn off attributes for subsequent writes."""
+        self.attr &= ~attr
+
+    def addstr(self, y, x, text, attr=0):
+        """Write text into the frame, clipping anything off screen."""
+        if not 0 <= y < self.height or x >= self.width or x + len(text) <= 0:
+            return
+        attr |= self.attr
+        if x < 0:
+            text = text[-x:]
+            x = 0
+        text = text[:self.width - x]
+        end = x + len(text)
+        self.cur[y][x:end] = text
+        self.cur_attrs[y][x:end] = [attr] * len(text)
+
+    def addch(self, y, x, ch, attr=0):
+        """Write a single character into the frame."""
+        self.addstr(y, x, ch, attr)
+
+    def flush(self, win):
+        """Send rows that differ from the previous frame to a curses window.
+
+        Each changed row is rewritten from its first to its last changed
+        cell, one addstr() call per run of cells sharing an attribute, so
+        the cursor never has to jump over unchanged cells. The window's
+        attributes are only switched when a run needs different ones.
+        Returns True if anything was written.
+        """
+        changed = False
+        win_attr = None
+        for y in range(self.height):
+            row, prev_row = self.cur[y], self.prev[y]
+            attrs, prev_attrs = self.cur_attrs[y], self.prev_attrs[y]
+            if row == prev_row and attrs == prev_attrs:
+                continue
+            changed = True
+            lo = 0
+            while row[lo] == prev_row[lo] and attrs[lo] == prev_attrs[lo]:
+                lo += 1
+            hi = self.width
+            while row[hi - 1] == prev_row[hi - 1] and attrs[hi - 1] == prev_attrs[hi - 1]:
+                hi -= 1
+            x = lo
+            while x < hi:
+                start = x
+                attr = attrs[x]
+                x += 1
+                while x < hi and attrs[x] == attr:
+                    x += 1
+                if attr != win_attr:
+                    win.attrset(attr)
+                    win_attr = attr
+                try:
+                    win.addstr(y, start, ''.join(row[start:x]))
+                except:
+                    pass
+        self.prev, self.cur = self.cur, self.prev
+        self.prev_attrs, self.cur_attrs = self.cur_attrs, self.prev_attrs
+        return changed
+
+
+class HudPanel:
+    """Block of HUD text drawn over the world that tracks which lines changed.
+
+    Only the cells holding text are drawn, so the world stays visible
+    around and between the lines.
+    """
+
+    def __init__(self, y, x, rows, labels=()):
+        self.y = y
+        self.x = x
+        # Static row labels; values go after them
+        self.labels = list(labels) + [''] * (rows - len(labels))
+        self.lines = [None] * rows
+        self.dirty = True
+
+    def set_line(self, row, text, attr=0, col=0):
+        """Set the text shown on a panel row, marking the panel dirty if it changed."""
+        if self.lines[row] == (text, attr, col):
+            return
+        self.lines[row] = (text, attr, col)
+        self.dirty = True
+
+    def set_value(self, row, text, attr=0):
+        """Show a value after the row's static label."""
+        self.set_line(row, text, attr, len(self.labels[row]))
+
+    def draw(self, screen):
+        """Draw the panel's text into the frame buffer."""
+        for row, label in enumerate(self.labels):
+            y = self.y + row
+            if label:
+                screen.addstr(y, self.x, label)
+            line = self.lines[row]
+            if line is not None:
+                text, attr, col = line
+                screen.addstr(y, self.x + col, text, attr)
+        self.dirty = False
+
+
+def make_world_renderer(height, width):
+    """Build a world-drawing function specialised for one screen size.
+
+    Positions that depend only on the screen size are computed once here
+    and captured by the returned function instead of every frame.
+    """
+    plane_x = width // 3
+    collect_x = plane_x + 4
+    ground_ys = [height - 1 - level for level in range(_MAX_GROUND_HEIGHT)]
+
+    def render_world(screen, ground_rows, collectible_manager, plane_y, crashed, show_collect_msg):
+        """Draw one frame of the world into the frame buffer."""
+        addstr = screen.addstr
+        screen.clear()
+
+        # Draw ground one screen row at a time, bottom up
+        for y, row in zip(ground_ys, ground_rows):
+            addstr(y, 0, row)
+
+        # Draw collectibles
+        collectible_manager.draw(screen)
+
+        # Draw plane
+        if crashed:
+            addstr(plane_y, plane_x, 'X*X')
+        else:
+            addstr(plane_y, plane_x, '>-o')
 
+        # Collection feedback
+        if show_collect_msg:
+            addstr(plane_y - 2, collect_x, "+50!", curses.A_BOLD)
 
-def main(stdscr):
+    return render_world
+
+
+async def main(stdscr):
     curses.curs_set(0)  # Hide cursor
     stdscr.nodelay(1)   # Non-blocking input
-    stdscr.timeout(50)  # 50ms timeout
+
+    # Read keys whenever stdin becomes readable instead of blocking in getch()
+    loop = asyncio.get_running_loop()
+    keys = collections.deque()
+
+    def on_key():
+        key = stdscr.getch()
+        while key != -1:
+            keys.append(key)
+            key = stdscr.getch()
+
+    stdin_fd = sys.stdin.fileno()
+    loop.add_reader(stdin_fd, on_key)
 
     height, width = stdscr.getmaxyx()
+    # Nothing is drawn on stdscr itself; refresh it once up front so getch()
+    # never repaints it over the world pad
+    stdscr.refresh()
+    world_pad = curses.newpad(height, width)
+    screen = FrameBuffer(height, width)
+    render_world = make_world_renderer(height, width)
+    hud = HudPanel(1, 2, 9, _HUD_LABELS)
+    controls = HudPanel(height - 2, 2, 1)
+    controls.set_line(0, "W=Up S=Down Q=Quit")  # Static, written once
+    panels = [hud, controls]
 
     plane = SimplePlane(height)
     ground = SimpleGround(width)
@@ -247,33 +520,47 @@ def main(stdscr):
     crashed = False
     crash_reason = ""
     last_collect_frame = -10  # For visual feedback
+    showed_collect_msg = False
+    dirty = True  # Whether the world needs redrawing this frame
+    ground_rows = None  # Cached ground row strings, bottom row first
+    crash_panel = None
+
+    # Bind hot callables and per-run constants to locals so the loop body
+    # uses fast local lookups instead of repeated attribute lookups
+    now = loop.time
+    get_pitch = _PITCH.get
+    set_hud_value = hud.set_value
+    doupdate = curses.doupdate
+    plane_x = width // 3
 
     while True:
-        # Input
-        key = stdscr.getch()
-        if key == ord('q') or key == ord('Q'):
-            break
+        frame_start = now()
 
+        # Input: drain every key queued since the last frame so held keys
+        # can't build a backlog; the most recent pitch key wins
+        if not _QUIT.isdisjoint(keys):
+            break
         pitch = 0
-        if key == ord('w') or key == ord('W'):
-            pitch = 1
-        elif key == ord('s') or key == ord('S'):
-            pitch = -1
+        for key in keys:
+            pitch = get_pitch(key, pitch)
+        keys.clear()
 
-        # Update
+        # Update, noting whether anything visible in the world changed
         if not crashed:
+            prev_plane_y = int(plane.altitude)
             plane.update(pitch)
+            dirty |= int(plane.altitude) != prev_plane_y
             difficulty_manager.update(frame)
             scroll_freq = difficulty_manager.get_scroll_frequency()
-            if frame % scroll_freq == 0:  # Dynamic scroll speed
-                ground.scroll()
+            if frame % scroll_freq == 0 and ground.scroll():  # Dynamic scroll speed
+                ground_rows = None  # Terrain moved; rebuild the cached rows
+                dirty = True
             ground.set_difficulty(difficulty_manager.level)
             score_manager.update(frame)
-            collectible_manager.update(frame)
+            dirty |= collectible_manager.update(frame)
 
         # Collision detection
         if not crashed:
-            plane_x = width // 3
             plane_y = int(plane.altitude)
             ground_height = ground.get_height(plane_x)
             ground_top_y = height - ground_height
@@ -286,102 +573,105 @@ def main(stdscr):
                 if fuel > 0:
                     plane.add_fuel(fuel)
                 last_collect_frame = frame
+                dirty = True
 
             # Check if plane hits ground
             if plane_y >= ground_top_y - 1:
                 crashed = True
                 crash_reason = "ground"
                 score_manager.check_high_score()
+                dirty = True
 
             # Check if plane runs out of fuel
             if plane.is_out_of_fuel():
                 crashed = True
                 crash_reason = "fuel"
                 score_manager.check_high_score()
-
-        # Draw
-        stdscr.clear()
-
-        # Draw ground
-        for x in range(width):
-            ground_h = ground.get_height(x)
-            for y in range(ground_h):
-                try:
-                    stdscr.addch(height - 1 - y, x, '#')
-                except:
-                    pass
-
-        # Draw collectibles
-        collectible_manager.draw(stdscr)
-
-        # Draw plane
-        plane_x = width // 3
-        plane_y = int(plane.altitude)
-        try:
-            if crashed:
-                stdscr.addstr(plane_y, plane_x, 'X*X')
-            else:
-                stdscr.addstr(plane_y, plane_x, '>-o')
-        except:
-            pass
-
-        # Draw HUD
-        try:
-            stdscr.addstr(1, 2, f"Altitude: {int(height - plane.altitude):3d}")
-            stdscr.addstr(2, 2, f"Velocity: {plane.velocity:5.1f}")
-            stdscr.addstr(3, 2, f"Distance: {score_manager.distance:4d}")
-            stdscr.addstr(4, 2, f"Time:     {score_manager.time_survived:5.1f}s")
-            stdscr.addstr(5, 2, f"Stars:    {score_manager.collectibles:3d}")
-            stdscr.addstr(6, 2, f"Score:    {score_manager.get_score():5d}")
-            stdscr.addstr(7, 2, f"High:     {score_manager.high_score:5d}")
-
-            # Fuel gauge with visual bar
-            fuel_percent = int((plane.fuel / plane.max_fuel) * 10)
-            fuel_bar = '█' * fuel_percent + '░' * (10 - fuel_percent)
-            fuel_text = f"Fuel: {fuel_bar} {plane.fuel:5.1f}%"
-            if plane.fuel < 20:
-                stdscr.addstr(8, 2, fuel_text, curses.A_BOLD | curses.A_BLINK)
+                dirty = True
+
+        show_collect_msg = frame - last_collect_frame < 10
+        if show_collect_msg != showed_collect_msg:
+            showed_collect_msg = show_collect_msg
+            dirty = True
+
+        # Update HUD values after their static labels (the panel only
+        # marks itself dirty when a value actually changed)
+        set_hud_value(0, format(int(height - plane.altitude), '3d'))
+        set_hud_value(1, format(plane.velocity, '5.1f'))
+        set_hud_value(2, format(score_manager.distance, '4d'))
+        set_hud_value(3, format(score_manager.time_survived, '5.1f') + 's')
+        set_hud_value(4, format(score_manager.collectibles, '3d'))
+        set_hud_value(5, format(score_manager.get_score(), '5d'))
+        set_hud_value(6, format(score_manager.high_score, '5d'))
+
+        # Fuel gauge with visual bar
+        fuel_percent = int((plane.fuel / plane.max_fuel) * 10)
+        fuel_text = _FUEL_BARS[fuel_percent] + ' ' + format(plane.fuel, '5.1f') + '%'
+        if plane.fuel < 20:
+            set_hud_value(7, fuel_text, curses.A_BOLD | curses.A_BLINK)
+        else:
+            set_hud_value(7, fuel_text)
+
+        # Difficulty level
+        set_hud_value(8, format(difficulty_manager.level, '2d'))
+
+        # Crash message, set up once in its own overlay panel
+        if crashed and crash_panel is None:
+            if crash_reason == "fuel":
+                crash_msg = "*** OUT OF FUEL! Press Q to quit ***"
             else:
-                stdscr.addstr(8, 2, fuel_text)
-
-            # Difficulty level
-            stdscr.addstr(9, 2, f"Level:    {difficulty_manager.level:2d}")
-
-            stdscr.addstr(height - 2, 2, "W=Up S=Down Q=Quit")
-
-            # Collection feedback
-            if frame - last_collect_frame < 10:
-                collect_msg = "+50!"
+                crash_msg = "*** CRASHED! Press Q to quit ***"
+            crash_x = (width - len(crash_msg)) // 2
+            crash_y = height // 2
+
+            # Show final score
+            final_score_msg = f"Final Score: {score_manager.get_score()}"
+            if score_manager.get_score() >= score_manager.high_score:
+                final_score_msg += " - NEW HIGH SCORE!"
+            final_x = (width - len(final_score_msg)) // 2
+
+            # Keep the start of each message on screen on narrow terminals
+            panel_x = max(0, min(crash_x, final_x))
+            crash_x = max(crash_x, panel_x)
+            final_x = max(final_x, panel_x)
+            crash_panel = HudPanel(crash_y, panel_x, 2)
+            crash_panel.set_line(0, crash_msg, curses.A_BOLD | curses.A_BLINK, crash_x - panel_x)
+            crash_panel.set_line(1, final_score_msg, curses.A_BOLD, final_x - panel_x)
+            panels.append(crash_panel)
+
+        # Draw the world and the HUD panels over it into the frame buffer,
+        # but only on frames where something changed; only changed cells
+        # reach the terminal, in a single update
+        if dirty or any(panel.dirty for panel in panels):
+            # Ground rows are built by translating the column heights
+            # straight into '#' and ' ', and only rebuilt after the terrain
+            # actually scrolls
+            if ground_rows is None:
+                columns = ground.heights[ground.head:] + ground.heights[:ground.head]
+                ground_rows = [columns.translate(_GROUND_ROWS[level]).decode('ascii')
+                               for level in range(max(columns))]
+            render_world(screen, ground_rows, collectible_manager,
+                         int(plane.altitude), crashed, show_collect_msg)
+            for panel in panels:
+                panel.draw(screen)
+            if screen.flush(world_pad):
                 try:
-                    stdscr.addstr(plane_y - 2, plane_x + 4, collect_msg, curses.A_BOLD)
+                    world_pad.noutrefresh(0, 0, 0, 0, height - 1, width - 1)
+                    doupdate()
                 except:
                     pass
+            dirty = False
 
-            # Crash message
-            if crashed:
-                if crash_reason == "fuel":
-                    crash_msg = "*** OUT OF FUEL! Press Q to quit ***"
-                else:
-                    crash_msg = "*** CRASHED! Press Q to quit ***"
-                crash_x = (width - len(crash_msg)) // 2
-                crash_y = height // 2
-                stdscr.addstr(crash_y, crash_x, crash_msg, curses.A_BOLD | curses.A_BLINK)
-
-                # Show final score
-                final_score_msg = f"Final Score: {score_manager.get_score()}"
-                if score_manager.get_score() >= score_manager.high_score:
-                    final_score_msg += " - NEW HIGH SCORE!"
-                final_x = (width - len(final_score_msg)) // 2
-                stdscr.addstr(crash_y + 1, final_x, final_score_msg, curses.A_BOLD)
-        except:
-            pass
-
-        stdscr.refresh()
         frame += 1
 
+        # Sleep off the rest of the frame so pacing doesn't drift with render time
+        await asyncio.sleep(max(0.0, FRAME_TIME - (now() - frame_start)))
+
+    loop.remove_reader(stdin_fd)
+
 
 if __name__ == "__main__":
     try:
-        curses.wrapper(main)
+        curses.wrapper(lambda stdscr: asyncio.run(main(stdscr)))
     except KeyboardInterrupt:
         pass